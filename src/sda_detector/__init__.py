@@ -43,7 +43,7 @@ Key SDA patterns demonstrated:
 # Minimal public API - only what external users need
 from .models import ArchitectureReport, ModuleType, PatternType, PositivePattern
 from .service import analyze_module as service_analyze_module
-from .service import main
+from .service import clear_cache, main
 
 # Version info
 __version__ = "0.1.0"
@@ -52,17 +52,22 @@ __description__ = "Semantic Domain Architecture pattern detector for Python"
 
 
 # Convenience functions for programmatic usage
-def analyze_module(module_path: str, module_name: str | None = None) -> ArchitectureReport:
+def analyze_module(module_path: str, module_name: str | None = None, *, parallel: bool = False) -> ArchitectureReport:
     """Analyze a module for SDA compliance.
 
     Args:
         module_path: Path to the Python file or directory to analyze
         module_name: Optional display name for the module in reports
+        parallel: Spread large batches of files over worker processes.
+            Off by default: worker processes re-import the main module under
+            the spawn start method (macOS, Windows), so a script that turns
+            this on must call analyze_module() under an
+            `if __name__ == "__main__":` guard.
 
     Returns:
         ArchitectureReport containing all findings and metrics
     """
-    return service_analyze_module(module_path, module_name)
+    return service_analyze_module(module_path, module_name, parallel=parallel)
 
 
 def print_report(report: ArchitectureReport, module_name: str) -> None:
@@ -105,6 +110,7 @@ __all__ = [
     "__version__",
     # Main API functions
     "analyze_module",
+    "clear_cache",
     "main",
     "print_report",
 ]
@@ -39,7 +39,8 @@ and ensure all analyzers use consistent extraction patterns.
 """
 
 import ast
-from typing import TYPE_CHECKING
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Final
 
 from pydantic import BaseModel, ConfigDict, Field, computed_field
 
@@ -91,13 +92,13 @@ class ASTNodeMetadata(BaseModel):
     @property
     def is_structural(self) -> bool:
         """Is this a structural element (class/function)?"""
-        return self.category == ASTNodeCategory.STRUCTURAL
+        return self.category is ASTNodeCategory.STRUCTURAL
 
     @computed_field
     @property
     def is_behavioral(self) -> bool:
         """Is this a behavioral element (call/attribute)?"""
-        return self.category == ASTNodeCategory.BEHAVIORAL
+        return self.category is ASTNodeCategory.BEHAVIORAL
 
 
 def extract_ast_name(node: ast.AST) -> str:
@@ -119,30 +120,38 @@ def extract_ast_name(node: ast.AST) -> str:
     complex extraction logic.
     
     Pure discriminated union pattern - no isinstance or hasattr.
+
+    Performance Note:
+        The extractor table is built once at import (_NAME_EXTRACTORS).
+        Every analyzed call and attribute lands here, and rebuilding
+        eight lambdas and a dict per node cost more than the lookup.
     """
-    from collections.abc import Callable
-    from typing import Any
-    
-    # Teaching: Type-based dispatch - each type knows how to extract its name
-    # Using lambdas for inline extraction logic
-    name_extractors: dict[type[ast.AST], Callable[[Any], str]] = {
-        ast.FunctionDef: lambda n: n.name,
-        ast.AsyncFunctionDef: lambda n: n.name,
-        ast.ClassDef: lambda n: n.name,
-        ast.Name: lambda n: n.id,
-        ast.Attribute: lambda n: n.attr,
-        ast.Call: lambda n: extract_ast_name(n.func) if n.func else "unknown_call",  # Teaching: Recursive!
-        ast.If: lambda n: extract_ast_name(n.test) if n.test else "condition",
-    }
-    
-    node_type = type(node)
-    # Teaching: Default lambda creates descriptive name for unknown types
-    extractor = name_extractors.get(node_type, lambda n: f"unknown_{type(n).__name__.lower()}")
+    # Teaching: Default extractor creates descriptive name for unknown types
+    extractor = _NAME_EXTRACTORS.get(type(node), _unknown_node_name)
     
     # Teaching: Pure function dispatch - no conditionals!
     return extractor(node)
 
 
+def _unknown_node_name(node: ast.AST) -> str:
+    """Descriptive fallback name for node types without an extractor."""
+    return f"unknown_{type(node).__name__.lower()}"
+
+
+# Teaching: Type-based dispatch - each type knows how to extract its name.
+# The lambdas resolve extract_ast_name at call time, so the Call and If
+# entries can recurse through the same table.
+_NAME_EXTRACTORS: Final[dict[type[ast.AST], Callable[[Any], str]]] = {
+    ast.FunctionDef: lambda n: n.name,
+    ast.AsyncFunctionDef: lambda n: n.name,
+    ast.ClassDef: lambda n: n.name,
+    ast.Name: lambda n: n.id,
+    ast.Attribute: lambda n: n.attr,
+    ast.Call: lambda n: extract_ast_name(n.func) if n.func else "unknown_call",  # Teaching: Recursive!
+    ast.If: lambda n: extract_ast_name(n.test) if n.test else "condition",
+}
+
+
 def classify_ast_node(node: ast.AST) -> ASTNodeCategory:
     """Classify AST node into semantic category using pure type dispatch.
     
@@ -161,35 +170,36 @@ def classify_ast_node(node: ast.AST) -> ASTNodeCategory:
     
     Pure discriminated union - no isinstance chains.
     """
-    # Teaching: Exhaustive mapping of common AST node types
-    category_mapping = {
-        # STRUCTURAL: Define architecture - highest priority
-        ast.FunctionDef: ASTNodeCategory.STRUCTURAL,
-        ast.AsyncFunctionDef: ASTNodeCategory.STRUCTURAL,
-        ast.ClassDef: ASTNodeCategory.STRUCTURAL,
-        ast.Module: ASTNodeCategory.STRUCTURAL,
-        
-        # CONTROL_FLOW: Business logic often lives here
-        ast.If: ASTNodeCategory.CONTROL_FLOW,
-        ast.For: ASTNodeCategory.CONTROL_FLOW,
-        ast.While: ASTNodeCategory.CONTROL_FLOW,
-        ast.Try: ASTNodeCategory.CONTROL_FLOW,
-        ast.ExceptHandler: ASTNodeCategory.CONTROL_FLOW,
-        
-        # BEHAVIORAL: How code interacts with other code
-        ast.Call: ASTNodeCategory.BEHAVIORAL,
-        ast.Attribute: ASTNodeCategory.BEHAVIORAL,
-        ast.BinOp: ASTNodeCategory.BEHAVIORAL,
-        ast.UnaryOp: ASTNodeCategory.BEHAVIORAL,
-        ast.Compare: ASTNodeCategory.BEHAVIORAL,
-        
-        # DATA: Simple values - lowest analysis priority
-        ast.Name: ASTNodeCategory.DATA,
-        ast.Constant: ASTNodeCategory.DATA,
-    }
-    
     # Teaching: Default to DATA for unknown nodes (safest assumption)
-    return category_mapping.get(type(node), ASTNodeCategory.DATA)
+    return _NODE_CATEGORIES.get(type(node), ASTNodeCategory.DATA)
+
+
+# Teaching: Exhaustive mapping of common AST node types, built once at import
+_NODE_CATEGORIES: Final[dict[type[ast.AST], ASTNodeCategory]] = {
+    # STRUCTURAL: Define architecture - highest priority
+    ast.FunctionDef: ASTNodeCategory.STRUCTURAL,
+    ast.AsyncFunctionDef: ASTNodeCategory.STRUCTURAL,
+    ast.ClassDef: ASTNodeCategory.STRUCTURAL,
+    ast.Module: ASTNodeCategory.STRUCTURAL,
+    
+    # CONTROL_FLOW: Business logic often lives here
+    ast.If: ASTNodeCategory.CONTROL_FLOW,
+    ast.For: ASTNodeCategory.CONTROL_FLOW,
+    ast.While: ASTNodeCategory.CONTROL_FLOW,
+    ast.Try: ASTNodeCategory.CONTROL_FLOW,
+    ast.ExceptHandler: ASTNodeCategory.CONTROL_FLOW,
+    
+    # BEHAVIORAL: How code interacts with other code
+    ast.Call: ASTNodeCategory.BEHAVIORAL,
+    ast.Attribute: ASTNodeCategory.BEHAVIORAL,
+    ast.BinOp: ASTNodeCategory.BEHAVIORAL,
+    ast.UnaryOp: ASTNodeCategory.BEHAVIORAL,
+    ast.Compare: ASTNodeCategory.BEHAVIORAL,
+    
+    # DATA: Simple values - lowest analysis priority
+    ast.Name: ASTNodeCategory.DATA,
+    ast.Constant: ASTNodeCategory.DATA,
+}
 
 
 def extract_ast_metadata(node: ast.AST) -> ASTNodeMetadata:
@@ -41,14 +41,14 @@ SDA pattern machinery. This consistency makes the codebase predictable.
 
 import ast
 from enum import StrEnum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 if TYPE_CHECKING:
-    from ..analysis_domain import Finding
     from ..context_domain import RichAnalysisContext
 
+from ..analysis_domain import Finding
 from ..core_types import PatternType, PositivePattern
 from .ast_utils import ASTNodeMetadata, extract_ast_metadata
 
@@ -92,32 +92,34 @@ class AttributePattern(StrEnum):
         3. Easy to extend (pattern could create multiple findings)
         4. Empty list is falsy but safe to iterate
         
-        The dictionary values are lists created at call time.
-        This is fine for small lists but could use lambdas for
-        expensive computations.
+        The table maps each pattern to the finding types it reports,
+        and is built once at import: building the full dict per call
+        validated a Finding for every pattern, only to keep one.
         """
-        from ..analysis_domain import Finding
-
         # Pure dictionary dispatch - patterns decide their own findings
-        finding_creators = {
-            AttributePattern.ENUM_UNWRAPPING: [
-                Finding(
-                    file_path=file_path,
-                    line_number=line_number,
-                    description=f"{PatternType.ENUM_VALUE_ACCESS}: {attribute_name}",
-                )
-            ],
-            AttributePattern.COMPUTED_FIELD_CANDIDATE: [
-                Finding(
-                    file_path=file_path,
-                    line_number=line_number,
-                    description=f"{PositivePattern.COMPUTED_FIELDS}: {attribute_name}",
-                )
-            ],
-            AttributePattern.NORMAL_ACCESS: [],  # Normal access produces no findings
-        }
-
-        return finding_creators[self]
+        return [
+            Finding(
+                file_path=file_path,
+                line_number=line_number,
+                description=f"{finding_type}: {attribute_name}",
+            )
+            for finding_type in _ATTRIBUTE_FINDING_TYPES[self]
+        ]
+
+
+_ATTRIBUTE_FINDING_TYPES: Final[dict[AttributePattern, tuple[PatternType | PositivePattern, ...]]] = {
+    AttributePattern.ENUM_UNWRAPPING: (PatternType.ENUM_VALUE_ACCESS,),
+    AttributePattern.COMPUTED_FIELD_CANDIDATE: (PositivePattern.COMPUTED_FIELDS,),
+    AttributePattern.NORMAL_ACCESS: (),  # Normal access produces no findings
+}
+
+# Indexed by (is_enum_unwrapping << 1) | suggests_computed_field
+_ATTRIBUTE_PATTERN_TABLE: Final[tuple[AttributePattern, ...]] = (
+    AttributePattern.NORMAL_ACCESS,  # 0b00 - neither
+    AttributePattern.COMPUTED_FIELD_CANDIDATE,  # 0b01 - computed_field only
+    AttributePattern.ENUM_UNWRAPPING,  # 0b10 - enum_unwrapping only
+    AttributePattern.ENUM_UNWRAPPING,  # 0b11 - enum_unwrapping takes priority
+)
 
 
 class AttributeDomain(BaseModel):
@@ -193,7 +195,7 @@ class AttributeDomain(BaseModel):
         the same pattern:
         
         1. Compute boolean flags
-        2. Create tuple key
+        2. Pack them into the bits of an index
         3. Map all possibilities
         4. Look up result
         
@@ -201,17 +203,10 @@ class AttributeDomain(BaseModel):
         This reflects severity - enum misuse is worse than
         missing computed fields.
         """
-        # Teaching: Pure boolean tuple dispatch - no conditionals!
-        # All 4 combinations explicitly handled with clear priorities
-        pattern_mapping = {
-            (True, True): AttributePattern.ENUM_UNWRAPPING,  # enum_unwrapping takes priority
-            (True, False): AttributePattern.ENUM_UNWRAPPING,  # enum_unwrapping only
-            (False, True): AttributePattern.COMPUTED_FIELD_CANDIDATE,  # computed_field only
-            (False, False): AttributePattern.NORMAL_ACCESS,  # neither
-        }
-
-        classification_key = (self.is_enum_unwrapping, self.suggests_computed_field)
-        return pattern_mapping[classification_key]
+        # Teaching: Pure boolean index dispatch - no conditionals!
+        # All 4 combinations explicitly handled in _ATTRIBUTE_PATTERN_TABLE;
+        # the packed index needs no per-call key tuple or hashing
+        return _ATTRIBUTE_PATTERN_TABLE[(self.is_enum_unwrapping << 1) | self.suggests_computed_field]
 
     def analyze(self, context: "RichAnalysisContext") -> list["Finding"]:
         """Self-analyzing domain model using enum behavioral methods.
@@ -44,14 +44,15 @@ are used to find conditionals!
 
 import ast
 from enum import StrEnum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from pydantic import BaseModel, ConfigDict, Field, computed_field
 
+from ..analysis_domain import Finding
+from ..core_types import PatternType, PositivePattern
 from .ast_utils import ASTNodeMetadata, extract_ast_metadata
 
 if TYPE_CHECKING:
-    from ..analysis_domain import Finding
     from ..context_domain import RichAnalysisContext
 
 
@@ -105,19 +106,8 @@ class ConditionalPattern(StrEnum):
         - TYPE_GUARD/VALIDATION/BOUNDARY -> Positive patterns (necessary)
         - LAZY_INIT/BUSINESS_LOGIC -> Violations (avoidable)
         """
-        from ..analysis_domain import Finding
-        from ..core_types import PatternType, PositivePattern
-
         # Each enum value knows its corresponding finding type
-        finding_types = {
-            ConditionalPattern.TYPE_GUARD: PositivePattern.TYPE_CHECKING_IMPORTS,
-            ConditionalPattern.VALIDATION_CHECK: PositivePattern.BOUNDARY_CONDITIONS,
-            ConditionalPattern.BOUNDARY_CONDITION: PositivePattern.BOUNDARY_CONDITIONS,
-            ConditionalPattern.LAZY_INITIALIZATION: PatternType.BUSINESS_CONDITIONALS,  # Lazy init is a violation
-            ConditionalPattern.BUSINESS_LOGIC: PatternType.BUSINESS_CONDITIONALS,
-        }
-
-        finding_type = finding_types[self]
+        finding_type = _CONDITIONAL_FINDING_TYPES[self]
         return Finding(
             file_path=file_path,
             line_number=line_number,
@@ -125,6 +115,50 @@ class ConditionalPattern(StrEnum):
         )
 
 
+# Built once at import rather than per create_finding() call
+_CONDITIONAL_FINDING_TYPES: Final[dict[ConditionalPattern, PatternType | PositivePattern]] = {
+    ConditionalPattern.TYPE_GUARD: PositivePattern.TYPE_CHECKING_IMPORTS,
+    ConditionalPattern.VALIDATION_CHECK: PositivePattern.BOUNDARY_CONDITIONS,
+    ConditionalPattern.BOUNDARY_CONDITION: PositivePattern.BOUNDARY_CONDITIONS,
+    ConditionalPattern.LAZY_INITIALIZATION: PatternType.BUSINESS_CONDITIONALS,  # Lazy init is a violation
+    ConditionalPattern.BUSINESS_LOGIC: PatternType.BUSINESS_CONDITIONALS,
+}
+
+# Exhaustive mapping of all 16 flag combinations, keyed by
+# (type_checking, validation, lazy_init, boundary). Every row is spelled out
+# so the priority can be read straight off the table - no if/elif needed!
+_CONDITIONAL_PATTERN_SPEC: Final[dict[tuple[bool, bool, bool, bool], ConditionalPattern]] = {
+    # type   valid  lazy   bound
+    (False, False, False, False): ConditionalPattern.BUSINESS_LOGIC,  # Default
+    (False, False, False, True): ConditionalPattern.BOUNDARY_CONDITION,  # Boundary - fourth priority
+    (False, False, True, False): ConditionalPattern.LAZY_INITIALIZATION,  # Lazy init - third priority
+    (False, False, True, True): ConditionalPattern.LAZY_INITIALIZATION,
+    (False, True, False, False): ConditionalPattern.VALIDATION_CHECK,  # Validation - second priority
+    (False, True, False, True): ConditionalPattern.VALIDATION_CHECK,
+    (False, True, True, False): ConditionalPattern.VALIDATION_CHECK,
+    (False, True, True, True): ConditionalPattern.VALIDATION_CHECK,
+    (True, False, False, False): ConditionalPattern.TYPE_GUARD,  # Type checking - highest priority
+    (True, False, False, True): ConditionalPattern.TYPE_GUARD,
+    (True, False, True, False): ConditionalPattern.TYPE_GUARD,
+    (True, False, True, True): ConditionalPattern.TYPE_GUARD,
+    (True, True, False, False): ConditionalPattern.TYPE_GUARD,
+    (True, True, False, True): ConditionalPattern.TYPE_GUARD,
+    (True, True, True, False): ConditionalPattern.TYPE_GUARD,
+    (True, True, True, True): ConditionalPattern.TYPE_GUARD,
+}
+
+# The spec flattened for the per-node lookup, indexed by
+# (type_checking << 3) | (validation << 2) | (lazy_init << 1) | boundary.
+# Each key's flags are packed the same way, so the two cannot disagree.
+_CONDITIONAL_PATTERN_TABLE: Final[tuple[ConditionalPattern, ...]] = tuple(
+    pattern
+    for _, pattern in sorted(
+        ((type_check << 3) | (validation << 2) | (lazy_init << 1) | boundary, pattern)
+        for (type_check, validation, lazy_init, boundary), pattern in _CONDITIONAL_PATTERN_SPEC.items()
+    )
+)
+
+
 class ConditionalDomain(BaseModel):
     """Domain model for conditional logic analysis - Self-Classifying Intelligence.
     
@@ -214,7 +248,7 @@ class ConditionalDomain(BaseModel):
         
         How it works:
         1. Compute 4 boolean flags (each True/False)
-        2. Create a tuple from them - this gives 2^4 = 16 possibilities
+        2. Pack them into the bits of an index - 2^4 = 16 possibilities
         3. Map EVERY possibility to a classification
         4. Look up the result - pure O(1) dispatch!
         
@@ -232,49 +266,21 @@ class ConditionalDomain(BaseModel):
         5. Default to business logic (1 entry)
         
         This replaces what would be nested if/elif logic with pure data!
+        The readable spec (_CONDITIONAL_PATTERN_SPEC) lists all 16 flag
+        tuples; it is flattened once at import into _CONDITIONAL_PATTERN_TABLE,
+        so the packed index means no key tuple is allocated or hashed per call.
         """
-        # Create classification key based on computed properties
+        # Create classification flags based on computed properties
         validation_scope = bool(self.parent_scope and "validate" in self.parent_scope.lower())
-        
-        # Pure tuple-based dispatch for pattern classification
-        classification_key = (
-            self.is_type_checking,
-            validation_scope,
-            self.is_lazy_initialization,
-            self.suggests_boundary_logic
+
+        # Pure index-based dispatch for pattern classification
+        classification_index = (
+            (self.is_type_checking << 3)
+            | (validation_scope << 2)
+            | (self.is_lazy_initialization << 1)
+            | self.suggests_boundary_logic
         )
-        
-        # Teaching: Exhaustive mapping of all 16 combinations
-        # Priority is encoded in the mapping itself - no if/elif needed!
-        classification_map = {
-            # Type checking takes highest priority
-            (True, False, False, False): ConditionalPattern.TYPE_GUARD,
-            (True, False, False, True): ConditionalPattern.TYPE_GUARD,
-            (True, False, True, False): ConditionalPattern.TYPE_GUARD,
-            (True, False, True, True): ConditionalPattern.TYPE_GUARD,
-            (True, True, False, False): ConditionalPattern.TYPE_GUARD,
-            (True, True, False, True): ConditionalPattern.TYPE_GUARD,
-            (True, True, True, False): ConditionalPattern.TYPE_GUARD,
-            (True, True, True, True): ConditionalPattern.TYPE_GUARD,
-            
-            # Validation scope takes second priority
-            (False, True, False, False): ConditionalPattern.VALIDATION_CHECK,
-            (False, True, False, True): ConditionalPattern.VALIDATION_CHECK,
-            (False, True, True, False): ConditionalPattern.VALIDATION_CHECK,
-            (False, True, True, True): ConditionalPattern.VALIDATION_CHECK,
-            
-            # Lazy initialization takes third priority
-            (False, False, True, False): ConditionalPattern.LAZY_INITIALIZATION,
-            (False, False, True, True): ConditionalPattern.LAZY_INITIALIZATION,
-            
-            # Boundary logic takes fourth priority
-            (False, False, False, True): ConditionalPattern.BOUNDARY_CONDITION,
-            
-            # Default to business logic
-            (False, False, False, False): ConditionalPattern.BUSINESS_LOGIC,
-        }
-        
-        return classification_map[classification_key]
+        return _CONDITIONAL_PATTERN_TABLE[classification_index]
 
     def analyze(self, context: "RichAnalysisContext") -> list["Finding"]:
         """Self-analyzing domain model using enum behavioral methods.
@@ -40,13 +40,13 @@ replaced with enums, constants, or domain types for type safety.
 
 import ast
 from collections import defaultdict
-from collections.abc import Callable
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from ..analysis_domain import Finding
+
 if TYPE_CHECKING:
-    from ..analysis_domain import Finding
     from ..context_domain import RichAnalysisContext
 
 
@@ -94,8 +94,6 @@ class LiteralDomain(BaseModel):
         The threshold of 2 is domain knowledge - single use is OK,
         repeated use suggests a missing abstraction.
         """
-        from ..analysis_domain import Finding
-        
         findings = []
         
         # Teaching: Pure functional filtering - no mutations
@@ -133,17 +131,11 @@ class LiteralDomain(BaseModel):
         literals: dict[str, list[int]] = defaultdict(list)  # Teaching: Auto-creates lists
         
         for node in ast.walk(tree):
-            # Check for string constants
-            node_type = type(node)
-            is_constant = node_type == ast.Constant
-            
-            # Teaching: Pure dispatch even for simple checks!
-            # This replaces: if is_constant: collect(node)
-            collectors: dict[bool, Callable[[Any], None]] = {
-                True: lambda n: cls._collect_if_string(n, literals),
-                False: lambda n: None  # Do nothing for non-constants
-            }
-            collectors[is_constant](node)  # Dispatch based on node type
+            # Teaching: A plain branch, not a dispatch dict. This runs for every
+            # node in the file, and a dict of two fresh lambdas per node cost
+            # more than the collection itself.
+            if type(node) is ast.Constant:
+                cls._collect_if_string(node, literals)
             
         return cls(literals=dict(literals))
     
@@ -169,15 +161,8 @@ class LiteralDomain(BaseModel):
         
         # Teaching: BOUNDARY isinstance - this is acceptable!
         # We're checking type of data from external system (AST)
-        is_valid_string = isinstance(value, str) and len(value) > 1
-        
-        # Teaching: Even after isinstance, we use dispatch!
-        # The str(value) cast is redundant but shows type discipline
-        handlers: dict[bool, Callable[[], None]] = {
-            True: lambda: literals[str(value)].append(line_no),  # Collect the literal
-            False: lambda: None  # Ignore non-strings or short strings
-        }
-        handlers[is_valid_string]()  # Execute selected handler
+        if isinstance(value, str) and len(value) > 1:
+            literals[value].append(line_no)
 
 
 class LiteralAnalyzer:
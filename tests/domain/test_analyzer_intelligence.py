@@ -6,11 +6,14 @@ Following SDA testing philosophy:
 - Test domain decisions, not framework features
 """
 
-from src.sda_detector.models.analyzers.ast_utils import ASTNodeMetadata
+import ast
+
+from src.sda_detector.models.analyzers.ast_utils import ASTNodeMetadata, extract_ast_metadata
 from src.sda_detector.models.analyzers.attribute_analyzer import AttributeDomain, AttributePattern
 from src.sda_detector.models.analyzers.call_analyzer import CallDomain, CallPattern
 from src.sda_detector.models.analyzers.conditional_analyzer import ConditionalDomain, ConditionalPattern
-from src.sda_detector.models.core_types import ASTNodeCategory
+from src.sda_detector.models.context_domain import RichAnalysisContext
+from src.sda_detector.models.core_types import ASTNodeCategory, ASTNodeType, ModuleType
 
 
 class TestCallDomainIntelligence:
@@ -122,6 +125,29 @@ class TestConditionalDomainIntelligence:
         # TYPE_CHECKING should still win due to priority
         assert type_check.is_type_checking is True
 
+    def test_conditional_pattern_table_covers_every_flag_combination(self):
+        """Test every packed index against the priority rule it is meant to encode."""
+        from src.sda_detector.models.analyzers.conditional_analyzer import (
+            _CONDITIONAL_PATTERN_SPEC,
+            _CONDITIONAL_PATTERN_TABLE,
+        )
+
+        assert len(_CONDITIONAL_PATTERN_TABLE) == len(_CONDITIONAL_PATTERN_SPEC) == 16
+        for index, pattern in enumerate(_CONDITIONAL_PATTERN_TABLE):
+            flags = (bool(index & 0b1000), bool(index & 0b0100), bool(index & 0b0010), bool(index & 0b0001))
+            type_checking, validation, lazy_init, boundary = flags
+            if type_checking:
+                expected = ConditionalPattern.TYPE_GUARD
+            elif validation:
+                expected = ConditionalPattern.VALIDATION_CHECK
+            elif lazy_init:
+                expected = ConditionalPattern.LAZY_INITIALIZATION
+            elif boundary:
+                expected = ConditionalPattern.BOUNDARY_CONDITION
+            else:
+                expected = ConditionalPattern.BUSINESS_LOGIC
+            assert pattern == expected == _CONDITIONAL_PATTERN_SPEC[flags], f"index {index:04b}"
+
 
 class TestAttributeDomainIntelligence:
     """Test the business logic in AttributeDomain classification."""
@@ -164,4 +190,66 @@ class TestAttributeDomainIntelligence:
         )
         assert normal_attr.is_enum_unwrapping is False
         assert normal_attr.suggests_computed_field is False
-        assert normal_attr.pattern_classification == AttributePattern.NORMAL_ACCESS
\ No newline at end of file
+        assert normal_attr.pattern_classification == AttributePattern.NORMAL_ACCESS
+
+
+class TestScopeHandoffIntelligence:
+    """Test that analyzers see the same context whether or not it is copied per node."""
+
+    def test_shared_context_matches_per_node_context(self):
+        """Only scope-reading analyzers get a scoped copy - results must not change."""
+        source = (
+            "class Service:\n"
+            "    def run(self, item):\n"
+            "        if isinstance(item, dict):\n"
+            "            return item.value\n"
+            "        match item:\n"
+            "            case _:\n"
+            "                return getattr(item, 'name')\n"
+        )
+        base_context = RichAnalysisContext(current_file="service.py", module_type=ModuleType.DOMAIN)
+        pending = [(ast.parse(source), ())]
+        while pending:
+            node, scopes = pending.pop()
+            node_type = ASTNodeType.from_ast(node)
+            full_context = base_context.model_copy(update={"scope_stack": scopes})
+            assert list(ASTNodeType.analyze_node(node, scopes, base_context)) == list(
+                node_type.create_analyzer_findings(node, full_context)
+            )
+            inner_scopes = ASTNodeType.child_scopes(node, scopes)
+            pending.extend((child, inner_scopes) for child in ast.iter_child_nodes(node))
+
+    def test_traversal_skips_only_unanalyzable_leaves(self):
+        """Names, constants and operators are dropped; anything that can hold a call is kept."""
+        call = ast.parse("total = price * 2 + fetch(key=lookup(order.id))").body[0].value
+        kept = [type(child) for child, _ in ASTNodeType.analyzed_children(call, ())]
+        assert kept == [ast.BinOp, ast.Call]  # price * 2 and fetch(...); the Add operator is dropped
+
+        fetch = call.right
+        kept = [type(child) for child, _ in ASTNodeType.analyzed_children(fetch, ())]
+        assert kept == [ast.keyword]  # The function Name is dropped, the keyword's nested call is not
+
+
+class TestNameExtractionIntelligence:
+    """Test the type-dispatched name extraction shared by all analyzers."""
+
+    def test_names_follow_node_type(self):
+        """Each node type reports its own name; unknown types get a descriptive fallback."""
+        cases = {
+            "def handler(): pass": "handler",
+            "class Order: pass": "Order",
+            "order.total": "total",
+            "client.fetch(order)": "fetch",
+            "(lambda: 1)()": "unknown_lambda",
+            "x + 1": "unknown_binop",
+        }
+        for source, expected_name in cases.items():
+            node = ast.parse(source).body[0]
+            node = getattr(node, "value", node)  # Unwrap expression statements
+            assert extract_ast_metadata(node).name == expected_name, source
+
+    def test_call_names_resolve_through_function_target(self):
+        """Calls are named after their target; anything but a name or attribute is unknown."""
+        assert CallDomain.from_ast(ast.parse("isinstance(x, int)").body[0].value).function_name == "isinstance"
+        assert CallDomain.from_ast(ast.parse("obj.model_dump()").body[0].value).function_name == "model_dump"
+        assert CallDomain.from_ast(ast.parse("factory()()").body[0].value).function_name == "unknown_function"
@@ -9,7 +9,8 @@ Focus: Business logic in enum methods, not enum value validation.
 
 from pydantic import BaseModel, ConfigDict, Field, computed_field
 
-from src.sda_detector.models.core_types import ModuleType
+from src.sda_detector.models.core_types import ModuleType, PathType
+from src.sda_detector.models.reporting_domain import ComplianceGrade
 
 
 class AnalysisPriorityTestCase(BaseModel):
@@ -217,6 +218,77 @@ def test_boundary_classification_completeness():
     )
 
 
+def test_module_path_classification_intelligence():
+    """Test ModuleType.from_path keyword precedence rules.
+
+    This tests the BUSINESS RULES: test code is always tooling, domain
+    keywords beat service keywords, and unmarked paths are mixed.
+    """
+    path_expectations = {
+        "src/shop/orders.py": ModuleType.MIXED,
+        "src/shop/api/orders.py": ModuleType.INFRASTRUCTURE,
+        "src/shop/models/orders.py": ModuleType.DOMAIN,
+        "src/shop/domain/order_service.py": ModuleType.DOMAIN,
+        "tests/test_orders.py": ModuleType.TOOLING,
+        "tests/test_order_service.py": ModuleType.TOOLING,
+        "tests/models/test_orders.py": ModuleType.TOOLING,
+        "tests/domain/test_order_api.py": ModuleType.TOOLING,
+        # Keywords are matched case-insensitively anywhere in the path, in a
+        # single scan that must agree with plain substring checks
+        "SRC/Shop/Domain/Orders.py": ModuleType.DOMAIN,
+        "src/rapid/orders.py": ModuleType.INFRASTRUCTURE,
+        "src/latest/orders.py": ModuleType.TOOLING,
+        "src/apimodels/orders.py": ModuleType.DOMAIN,
+    }
+
+    for module_path, expected in path_expectations.items():
+        actual = ModuleType.from_path(module_path)
+        assert actual == expected, f"{module_path}: expected {expected.name}, got {actual.name}"
+
+
+def test_path_type_file_resolution_intelligence():
+    """Test PathType classification and the files each path type resolves to.
+
+    This tests the BUSINESS RULES: a Python file analyzes itself, a
+    directory analyzes its top-level Python files, anything else is skipped.
+    """
+    fixture_dir = "tests/fixtures/patterns"
+    fixture_file = "tests/fixtures/patterns/rich_domain.py"
+    fixture_modules = ("protocols.py", "rich_domain.py", "type_dispatch.py")
+    path_expectations = {
+        fixture_dir: (PathType.DIRECTORY, {f"{fixture_dir}/{name}" for name in fixture_modules}),
+        fixture_file: (PathType.PYTHON_FILE, {fixture_file}),
+        "README.md": (PathType.OTHER, set()),
+        "tests/fixtures/does_not_exist": (PathType.OTHER, set()),
+    }
+
+    for path, (expected_type, expected_files) in path_expectations.items():
+        path_type = PathType.from_path(path)
+        assert path_type == expected_type, f"{path}: expected {expected_type.name}, got {path_type.name}"
+        assert set(path_type.get_python_files(path)) == expected_files, f"{path}: wrong files resolved"
+
+
+def test_compliance_grade_band_boundaries():
+    """Test ComplianceGrade.from_violation_count at every band edge.
+
+    This tests the BUSINESS RULES: zero violations is excellent, up to five
+    is good, up to fifteen needs improvement, and anything beyond is poor.
+    """
+    count_expectations = {
+        0: ComplianceGrade.EXCELLENT,
+        1: ComplianceGrade.GOOD,
+        5: ComplianceGrade.GOOD,
+        6: ComplianceGrade.NEEDS_IMPROVEMENT,
+        15: ComplianceGrade.NEEDS_IMPROVEMENT,
+        16: ComplianceGrade.POOR,
+        500: ComplianceGrade.POOR,
+    }
+
+    for count, expected in count_expectations.items():
+        actual = ComplianceGrade.from_violation_count(count)
+        assert actual == expected, f"{count} violations: expected {expected.name}, got {actual.name}"
+
+
 # Note: We deliberately DON'T test:
 # ❌ assert ModuleType.DOMAIN == "domain" (enum string values) - that's Pydantic's job
 # ❌ Enum validation or serialization - infrastructure plumbing
@@ -6,9 +6,13 @@ We dogfood our own principles by creating test cases as Pydantic models with
 @computed_field validation logic, rather than traditional procedural tests.
 """
 
+from collections import defaultdict
+
+import pytest
 from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 from src.sda_detector.models.analysis_domain import Finding
+from src.sda_detector.models.core_types import FindingClassifier
 
 
 class FindingLocationTestCase(BaseModel):
@@ -116,6 +120,63 @@ def test_finding_location_business_logic_edge_cases():
         assert case.is_valid_test_case, case.failure_reason
 
 
+class FindingClassificationTestCase(BaseModel):
+    """Test case model for FindingClassifier routing business rules.
+
+    Every combination of (violation, pattern) must classify the same way
+    whether a finding is classified on its own or routed straight into the
+    report collections.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    description: str = Field(min_length=1, description="Finding description to classify")
+    expected: FindingClassifier = Field(description="Expected classification")
+
+    @computed_field
+    @property
+    def is_valid_test_case(self) -> bool:
+        """Classification and fused routing agree with the expected bucket."""
+        finding = Finding(file_path="orders.py", line_number=1, description=self.description)
+        violations: defaultdict[str, list[Finding]] = defaultdict(list)
+        patterns: defaultdict[str, list[Finding]] = defaultdict(list)
+        FindingClassifier.route(finding, violations, patterns)
+
+        routed = {
+            FindingClassifier.VIOLATION: bool(violations) and not patterns,
+            FindingClassifier.PATTERN: bool(patterns) and not violations,
+            FindingClassifier.UNKNOWN: not violations and not patterns,
+        }
+        return FindingClassifier.from_finding(finding) == self.expected and routed[self.expected]
+
+
+def test_finding_classification_covers_every_state():
+    """Test all four (violation, pattern) states, including violation precedence."""
+    classification_cases = [
+        FindingClassificationTestCase(description="isinstance_usage: isinstance", expected=FindingClassifier.VIOLATION),
+        FindingClassificationTestCase(description="computed_fields: total", expected=FindingClassifier.PATTERN),
+        FindingClassificationTestCase(
+            description="business_conditionals: computed_fields", expected=FindingClassifier.VIOLATION
+        ),
+        FindingClassificationTestCase(description="string_literal_repetition: 'a'", expected=FindingClassifier.UNKNOWN),
+    ]
+
+    for case in classification_cases:
+        assert case.is_valid_test_case, f"{case.description!r} should classify as {case.expected}"
+
+
+def test_add_to_collections_is_a_deprecated_alias_for_route():
+    """Test the kept enum API warns and collects exactly like route()."""
+    finding = Finding(file_path="orders.py", line_number=1, description="isinstance_usage: isinstance")
+    violations, patterns = FindingClassifier.build_collections()
+
+    with pytest.warns(DeprecationWarning, match="route"):
+        FindingClassifier.from_finding(finding).add_to_collections(finding, violations, patterns)
+
+    assert [finding] == [collected for bucket in violations.values() for collected in bucket]
+    assert not patterns
+
+
 # Note: We DON'T test immutability here because:
 # Rule 050: "DON'T Test: State management (trust immutability)"
 # That's Pydantic's responsibility, not our domain intelligence!
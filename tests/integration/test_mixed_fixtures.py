@@ -4,7 +4,7 @@ Following SDA testing philosophy: Test realistic scenarios with mixed concerns.
 """
 
 from src.sda_detector import analyze_module
-from src.sda_detector.models import PositivePattern, PatternType
+from src.sda_detector.models import ArchitectureReport, PositivePattern, PatternType
 
 
 def test_mixed_fixtures_balanced_analysis():
@@ -79,3 +79,100 @@ def test_mixed_demonstrates_sda_principles():
 
     # Should demonstrate the value of SDA classification
     assert report.module_type in ["tooling", "mixed"], "Mixed fixtures should be classified appropriately"
+
+
+def test_report_statistics_match_findings():
+    """Test that cached report statistics agree with the findings they summarize."""
+    report = analyze_module("tests/fixtures/mixed", "Statistics Test")
+
+    expected_violations = sum(len(findings) for findings in report.violations.values())
+    expected_patterns = sum(len(findings) for findings in report.patterns.values())
+    expected_files = {
+        f.file_path for bucket in (report.violations, report.patterns) for v in bucket.values() for f in v
+    }
+
+    # Read twice - the second read is served from the per-report cache
+    for _ in range(2):
+        assert report.total_violations == expected_violations
+        assert report.total_patterns == expected_patterns
+        assert report.files_analyzed == len(expected_files)
+
+    dist = report.pattern_distribution
+    assert abs(dist["patterns"] + dist["violations"] - 1.0) < 1e-9
+    assert report.model_dump()["total_violations"] == expected_violations
+
+
+def test_model_copy_rederives_report_statistics():
+    """Test that a report copied with updated findings does not keep the original's statistics."""
+    report = analyze_module("tests/fixtures/mixed", "Copy Test")
+    # Warm every cached statistic on the original first
+    original = report.model_dump()
+    assert original["total_violations"] > 0
+
+    for update in ({"violations": {}}, {"patterns": {}}, {"violations": {}, "patterns": {}}):
+        copied = report.model_copy(update=update)
+        rebuilt = ArchitectureReport(
+            violations=update.get("violations", report.violations),
+            patterns=update.get("patterns", report.patterns),
+            module_type=report.module_type,
+        )
+        assert copied.model_dump() == rebuilt.model_dump(), update
+
+    cleaned = report.model_copy(update={"violations": {}})
+    assert cleaned.total_violations == 0
+    assert cleaned.compliance_grade == "excellent"
+    assert cleaned.celebration_header != report.celebration_header
+    # The original keeps its own statistics
+    assert report.model_dump() == original
+
+
+def test_report_statistics_cannot_be_edited_by_callers():
+    """Test that editing a returned distribution never changes what later reads see."""
+    report = analyze_module("tests/fixtures/mixed", "Mutation Test")
+    expected = dict(report.pattern_distribution)
+
+    report.pattern_distribution["x"] = 99.0
+    report.pattern_distribution["patterns"] = -1.0
+
+    assert report.pattern_distribution == expected
+    assert report.model_dump()["pattern_distribution"] == expected
+
+
+def test_scan_metrics_cache_survives_neither_copies_nor_callers():
+    """Test the nested metrics for both cache hazards: stale copies and shared containers."""
+    metrics = analyze_module("tests/fixtures/mixed", "Metrics Cache Test").scan_metrics
+    richness = metrics.architectural_richness
+    assert richness > 0
+
+    # A copy with no counts must not inherit the original's cached score
+    emptied = metrics.model_copy(update={"computed_fields_count": 0})
+    assert emptied.architectural_richness == 0.0
+    assert metrics.architectural_richness == richness
+
+    # Editing one returned summary must not change the next one
+    summary = metrics.excellence_summary
+    expected = list(summary)
+    summary.append("corrupted")
+    summary.clear()
+    assert metrics.excellence_summary == expected
+
+
+def test_report_buckets_are_plain_dicts():
+    """Test that grouping defaultdicts never leak into the frozen report."""
+    report = analyze_module("tests/fixtures/mixed", "Bucket Type Test")
+
+    assert type(report.violations) is dict
+    assert type(report.patterns) is dict
+    # Every bucket present holds at least one finding - no empty auto-created keys
+    assert all(report.violations.values())
+    assert all(report.patterns.values())
+
+
+def test_empty_module_reports_zero_distribution(tmp_path):
+    """Test that a module with nothing to find reports zeros, not a division error."""
+    (tmp_path / "empty.py").write_text("")
+    report = analyze_module(str(tmp_path), "Empty Module Test")
+
+    assert report.total_violations == 0
+    assert report.total_patterns == 0
+    assert report.pattern_distribution == {"patterns": 0.0, "violations": 0.0}
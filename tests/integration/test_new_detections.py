@@ -90,3 +90,102 @@ class TestNewPatternDetection:
             len(findings) for pattern, findings in report.violations.items() if "business_conditionals" in str(pattern)
         )
         assert conditional_count >= 2
+
+
+def test_repeated_analysis_tracks_file_edits(tmp_path):
+    """Verify unchanged files reuse their analysis and edited files are re-analyzed."""
+    source = tmp_path / "module.py"
+    source.write_text("def check(value):\n    return isinstance(value, int)\n")
+    service = DetectionService()
+
+    first = service.analyze_module(str(source))
+    second = service.analyze_module(str(source))
+    assert second.total_violations == first.total_violations > 0
+
+    # Edit the file - a different size guarantees a new cache key
+    source.write_text("def check(value):\n    return value\n")
+    edited = service.analyze_module(str(source))
+    assert edited.total_violations < first.total_violations
+
+
+def test_failed_reads_are_not_cached(tmp_path, monkeypatch):
+    """Verify a file that could not be read once is analyzed again on the next run."""
+    from src.sda_detector import service as service_module
+
+    source = tmp_path / "module.py"
+    source.write_text("def check(value):\n    return isinstance(value, int)\n")
+    service_module.clear_cache()
+
+    # Same file version both times - only the read outcome differs
+    with monkeypatch.context() as patched:
+        patched.setattr(service_module, "_read_source", lambda file_path: None)
+        unreadable = DetectionService().analyze_module(str(source))
+    readable = DetectionService().analyze_module(str(source))
+
+    assert unreadable.total_violations == 0
+    assert readable.total_violations > 0
+
+
+def test_parallel_analysis_matches_serial(monkeypatch):
+    """Verify spreading files over worker processes yields the same report."""
+    from src.sda_detector import service as service_module
+
+    fixture = "tests/fixtures/violations"
+    service_module.clear_cache()
+    serial = DetectionService().analyze_module(fixture)
+
+    # Force a pool: two workers, one file each is enough to start them
+    service_module.clear_cache()
+    monkeypatch.setattr(service_module, "_FILES_PER_WORKER", 1)
+    monkeypatch.setattr(service_module.os, "cpu_count", lambda: 2)
+    parallel = DetectionService().analyze_module(fixture, parallel=True)
+
+    assert parallel == serial
+
+
+def test_library_calls_never_start_worker_processes(monkeypatch):
+    """Verify worker processes are opt-in - unguarded scripts break under spawn."""
+    from src.sda_detector import analyze_module
+    from src.sda_detector import service as service_module
+
+    def refuse_pool(*args, **kwargs):
+        raise AssertionError("analyze_module started a process pool without parallel=True")
+
+    service_module.clear_cache()
+    monkeypatch.setattr(service_module, "_FILES_PER_WORKER", 1)
+    monkeypatch.setattr(service_module.os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(service_module, "ProcessPoolExecutor", refuse_pool)
+
+    report = analyze_module("tests/fixtures/violations")
+
+    assert report.total_violations > 0
+
+
+def test_read_ahead_keeps_a_bounded_window(monkeypatch):
+    """Verify sources arrive in order and reads never run far ahead of analysis."""
+    import threading
+    import time
+
+    from src.sda_detector import service as service_module
+
+    paths = sorted(str(path) for path in Path("tests/fixtures").rglob("*.py"))
+    assert len(paths) > service_module._READ_AHEAD_THREADS
+    expected = [service_module._read_source(path) for path in paths]
+    assert list(service_module._read_ahead(paths)) == expected
+    assert list(service_module._read_ahead(paths[:2])) == expected[:2]  # Too few files for a pool
+
+    reads: list[str] = []
+    lock = threading.Lock()
+    real_read = service_module._read_source
+
+    def counting_read(path):
+        with lock:
+            reads.append(path)
+        return real_read(path)
+
+    monkeypatch.setattr(service_module, "_read_source", counting_read)
+    sources = service_module._read_ahead(paths)
+    assert next(sources) == expected[0]
+    time.sleep(0.05)  # Give idle reader threads the chance to run ahead
+    assert len(reads) <= service_module._READ_AHEAD_THREADS
+    sources.close()